@@ -1,11 +1,20 @@
+import codecs
+import concurrent.futures
+import functools
+import html
+import http.client
+import itertools
 import json
+import operator
 import re
+import socket
+import threading
+import time
 import tkinter as tk
-from html.parser import HTMLParser
 from tkinter import ttk, messagebox
 import urllib.error
 import urllib.parse
-import urllib.request
+import zlib
 
 # Multiple TPB proxy endpoints; we try them in order until one works.
 API_ENDPOINTS = [
@@ -21,6 +30,18 @@ HTML_ENDPOINTS = [
     "https://tpb.party/search/{query}/1/99/{cat}",
 ]
 
+# str.format re-parses the template string on every probe; precompile both
+# endpoint lists to plain %-substitution once at import. Both template styles
+# take the query first, then the category.
+_API_TEMPLATES = [
+    endpoint.replace("{query}", "%s").replace("{category}", "%s")
+    for endpoint in API_ENDPOINTS
+]
+_HTML_TEMPLATES = [
+    endpoint.replace("{query}", "%s").replace("{cat}", "%s")
+    for endpoint in HTML_ENDPOINTS
+]
+
 # TPB category sets to query (we try each until we get results).
 CATEGORY_SETS = {
     "movies_hd": ["207", "201", "200"],  # HD Movies, then fallback to Movies/Video
@@ -35,26 +56,201 @@ TRACKERS = [
     "udp://tracker.leechers-paradise.org:6969/announce",
 ]
 
+# TRACKERS never changes, so the tr=... query fragment is precomputed once
+# instead of re-quoted on every magnet build.
+_TRACKERS_QS = "&".join(f"tr={urllib.parse.quote(tr)}" for tr in TRACKERS)
+
+# Shared pool for hedged endpoint probes. One worker per endpoint so a full
+# fan-out never queues; module-level so returning early doesn't block on
+# executor shutdown while a slow endpoint is still timing out.
+_PROBE_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=max(len(API_ENDPOINTS), len(HTML_ENDPOINTS))
+)
+
+# TPB pages are a few hundred KB of highly compressible markup; asking for
+# gzip/deflate cuts bytes-on-wire (and decode work downstream) several-fold.
+_REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"}
+
+
+def _decompressor(resp):
+    """Return a zlib decompressor for a compressed response body, else None.
+    wbits=47 auto-detects both gzip and zlib-wrapped deflate framing."""
+    if resp.getheader("Content-Encoding", "").lower() in ("gzip", "deflate"):
+        return zlib.decompressobj(47)
+    return None
+
+# getaddrinfo is a synchronous (and on some systems uncached) blocking call,
+# and every fresh connection triggers one. We only ever talk to the few hosts
+# in the endpoint lists, so cache their resolutions with a short TTL instead
+# of re-resolving on each probe. Unknown hosts pass straight through.
+_DNS_TTL = 300.0  # seconds
+_DNS_HOSTS = frozenset(
+    urllib.parse.urlsplit(endpoint).hostname
+    for endpoint in API_ENDPOINTS + HTML_ENDPOINTS
+)
+_dns_cache = {}
+_dns_lock = threading.Lock()
+_system_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, *args, **kwargs):
+    if host not in _DNS_HOSTS:
+        return _system_getaddrinfo(host, *args, **kwargs)
+    key = (host, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    with _dns_lock:
+        entry = _dns_cache.get(key)
+        if entry is not None and now - entry[0] < _DNS_TTL:
+            return entry[1]
+    result = _system_getaddrinfo(host, *args, **kwargs)
+    with _dns_lock:
+        _dns_cache[key] = (now, result)
+    return result
+
+
+socket.getaddrinfo = _cached_getaddrinfo
+
+# Per-thread keep-alive connections keyed by host. We hit the same few hosts
+# up to 9 times per search (endpoints x categories); reusing the TCP/TLS
+# session skips a handshake on every probe after the first. threading.local
+# avoids locking, since http.client connections are not thread-safe.
+_conn_local = threading.local()
+
+
+def _get_connection(host: str, timeout: float) -> http.client.HTTPSConnection:
+    conns = getattr(_conn_local, "conns", None)
+    if conns is None:
+        conns = _conn_local.conns = {}
+    conn = conns.get(host)
+    if conn is None:
+        conn = http.client.HTTPSConnection(host, timeout=timeout)
+        conns[host] = conn
+    return conn
+
+
+def _drop_connection(host: str) -> None:
+    conn = getattr(_conn_local, "conns", {}).pop(host, None)
+    if conn is not None:
+        conn.close()
+
+
+def _open_url(url: str, timeout: float):
+    """Open a GET request over a per-thread keep-alive connection, following
+    redirects; return (host, response) with the body left unread."""
+    for _ in range(5):
+        parsed = urllib.parse.urlsplit(url)
+        host = parsed.netloc
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+        for attempt in (0, 1):
+            conn = _get_connection(host, timeout)
+            reused = conn.sock is not None
+            try:
+                conn.request("GET", path, headers=_REQUEST_HEADERS)
+                resp = conn.getresponse()
+                break
+            except TimeoutError as exc:
+                _drop_connection(host)
+                raise urllib.error.URLError(exc) from exc
+            except (http.client.HTTPException, OSError) as exc:
+                # A kept-alive socket the server already closed fails on the
+                # first reuse; drop it and retry once on a fresh connection.
+                _drop_connection(host)
+                if attempt or not reused:
+                    raise urllib.error.URLError(exc) from exc
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            resp.read()  # Drain so the connection can be reused.
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if resp.status >= 400:
+            resp.read()
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return host, resp
+    raise urllib.error.URLError(f"Too many redirects for {url}")
+
+
+def _decompress(decomp, data: bytes, first: bool):
+    """Decompress one block, mapping zlib.error to URLError so a corrupt body
+    from one endpoint falls over to the next instead of aborting the search.
+    On the first block, fall back to raw deflate for servers that advertise
+    deflate but skip the zlib wrapper (which wbits=47 rejects up front).
+    Returns (decompressor, output) since the fallback swaps the object."""
+    try:
+        return decomp, decomp.decompress(data)
+    except zlib.error as exc:
+        if not first:
+            raise urllib.error.URLError(exc) from exc
+        decomp = zlib.decompressobj(-zlib.MAX_WBITS)
+        try:
+            return decomp, decomp.decompress(data)
+        except zlib.error as exc:
+            raise urllib.error.URLError(exc) from exc
+
+
+def _http_get(url: str, timeout: float) -> bytes:
+    _, resp = _open_url(url, timeout)
+    body = resp.read()
+    decomp = _decompressor(resp)
+    if decomp is not None:
+        decomp, body = _decompress(decomp, body, first=True)
+        try:
+            body += decomp.flush()
+        except zlib.error as exc:
+            raise urllib.error.URLError(exc) from exc
+    return body
+
+
+def _iter_body(url: str, timeout: float, chunk_size: int = 65536):
+    """Yield the response body in chunks. Abandoning the iterator early drops
+    the half-read connection rather than returning it to the keep-alive cache."""
+    host, resp = _open_url(url, timeout)
+    decomp = _decompressor(resp)
+    first = True
+    try:
+        while chunk := resp.read(chunk_size):
+            if decomp is not None:
+                decomp, chunk = _decompress(decomp, chunk, first=first)
+                first = False
+                if not chunk:
+                    continue
+            yield chunk
+    finally:
+        if not resp.isclosed():
+            _drop_connection(host)
+
+
+# detDesc sizes are always "Size <number> <unit>", so a str.find plus two
+# character scans beats running the regex engine per text node. Units fold to
+# a single letter by dropping the i/B suffix ("GiB"/"GB" -> "g").
+_SIZE_SCALES = {"b": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+_SIZE_DIGITS = frozenset("0123456789.")
+
 
 def parse_size_bytes(text: str) -> int:
     """Extract size in bytes from TPB detDesc text."""
-    match = re.search(r"Size ([0-9]+(?:\.[0-9]+)?)\s*([A-Za-z]+)", text)
-    if not match:
+    i = text.find("Size ")
+    if i < 0:
+        return 0
+    j = i + 5
+    k = j
+    n = len(text)
+    while k < n and text[k] in _SIZE_DIGITS:
+        k += 1
+    if k == j:
         return 0
-    value = float(match.group(1))
-    unit = match.group(2).lower()
-    scale = {
-        "b": 1,
-        "kib": 1024,
-        "kb": 1024,
-        "mib": 1024 ** 2,
-        "mb": 1024 ** 2,
-        "gib": 1024 ** 3,
-        "gb": 1024 ** 3,
-        "tib": 1024 ** 4,
-        "tb": 1024 ** 4,
-    }.get(unit, 1)
-    return int(value * scale)
+    try:
+        value = float(text[j:k])
+    except ValueError:
+        return 0
+    while k < n and text[k].isspace():
+        k += 1
+    end = k
+    while end < n and text[end].isalpha():
+        end += 1
+    unit = text[k:end].lower().rstrip("ib") or "b"
+    return int(value * _SIZE_SCALES.get(unit, 1))
 
 
 def parse_btih_from_magnet(magnet: str) -> str | None:
@@ -69,149 +265,222 @@ def parse_btih_from_magnet(magnet: str) -> str | None:
     return None
 
 
-class TPBHTMLParser(HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self.rows = []
-        self._reset_row()
-
-    def _reset_row(self):
-        self.in_tr = False
-        self.in_det_name = False
-        self.in_title_anchor = False
-        self.in_det_desc = False
-        self.in_align_right = False
-        self.align_right_values = []
-        self.current = {"name": None, "magnet": None, "size": 0}
-
-    def handle_starttag(self, tag, attrs):
-        attrs = dict(attrs)
-        if tag == "tr":
-            self.in_tr = True
-            self.align_right_values = []
-            self.current = {"name": None, "magnet": None, "size": 0}
-            return
-        if not self.in_tr:
-            return
-        if tag == "div" and attrs.get("class") == "detName":
-            self.in_det_name = True
-        if tag == "font" and attrs.get("class") == "detDesc":
-            self.in_det_desc = True
-        if tag == "a":
-            href = attrs.get("href", "")
-            if href.startswith("magnet:?xt="):
-                self.current["magnet"] = href
-            elif self.in_det_name:
-                self.in_title_anchor = True
-        if tag == "td" and attrs.get("align") == "right":
-            self.in_align_right = True
-
-    def handle_endtag(self, tag):
-        if tag == "tr" and self.in_tr:
-            info_hash = parse_btih_from_magnet(self.current.get("magnet") or "")
-            if self.current.get("name") and info_hash:
-                seeders = int(self.align_right_values[0]) if len(self.align_right_values) > 0 else 0
-                leechers = int(self.align_right_values[1]) if len(self.align_right_values) > 1 else 0
-                self.rows.append(
-                    {
-                        "name": self.current.get("name"),
-                        "info_hash": info_hash,
-                        "seeders": seeders,
-                        "leechers": leechers,
-                        "size": self.current.get("size", 0),
-                    }
-                )
-            self._reset_row()
-        if tag == "div":
-            self.in_det_name = False
-        if tag == "a":
-            self.in_title_anchor = False
-        if tag == "font":
-            self.in_det_desc = False
-        if tag == "td" and self.in_align_right:
-            self.in_align_right = False
-
-    def handle_data(self, data):
-        if not self.in_tr:
-            return
-        text = data.strip()
-        if not text:
-            return
-        if self.in_title_anchor and self.in_det_name:
-            self.current["name"] = text
-        if self.in_det_desc:
-            size_bytes = parse_size_bytes(text)
-            if size_bytes:
-                self.current["size"] = size_bytes
-        if self.in_align_right and text.isdigit():
-            self.align_right_values.append(int(text))
+# Single combined alternation over the whole page: every field pattern is
+# matched in one pass, with bare <tr> matches acting as row boundaries,
+# instead of slicing out each row and re-scanning its substring four times.
+# This is the closest stdlib re gets to a multi-pattern DFA scan; re2 or
+# hyperscan would do it faster but mean a third-party dependency.
+_SCAN_RE = re.compile(
+    r"<tr[^>]*>"
+    r'|<div class="detName">.*?<a [^>]*>(?P<name>[^<]+)</a>'
+    r'|href="(?P<magnet>magnet:\?xt=[^"]+)"'
+    r'|class="detDesc">(?P<desc>.*?)</font>'
+    r'|<td align="right">\s*(?P<count>\d+)\s*</td>',
+    re.S,
+)
+
+
+def _make_row(name, magnet, desc, seeders, leechers):
+    info_hash = parse_btih_from_magnet(html.unescape(magnet))
+    name = html.unescape(name).strip()
+    if not name or not info_hash:
+        return None
+    return {
+        "name": name,
+        "info_hash": info_hash,
+        "seeders": int(seeders) if seeders else 0,
+        "leechers": int(leechers) if leechers else 0,
+        "size": parse_size_bytes(html.unescape(desc)) if desc else 0,
+    }
+
+
+def _iter_html_rows(page: str):
+    """Yield one row dict per parseable result row. Streaming generator: rows
+    missing a magnet or name are skipped without allocating anything, and a
+    caller that stops early (top-100 reached) stops the scan with it."""
+    name = magnet = desc = seeders = leechers = None
+    for match in _SCAN_RE.finditer(page):
+        kind = match.lastgroup
+        if kind is None:  # <tr>: commit the previous row, start the next.
+            if name is not None and magnet is not None:
+                row = _make_row(name, magnet, desc, seeders, leechers)
+                if row is not None:
+                    yield row
+            name = magnet = desc = seeders = leechers = None
+        elif kind == "name":
+            if name is None:
+                name = match.group("name")
+        elif kind == "magnet":
+            if magnet is None:
+                magnet = match.group("magnet")
+        elif kind == "desc":
+            if desc is None:
+                desc = match.group("desc")
+        elif seeders is None:  # first right-aligned count in the row
+            seeders = match.group("count")
+        elif leechers is None:
+            leechers = match.group("count")
+    if name is not None and magnet is not None:
+        row = _make_row(name, magnet, desc, seeders, leechers)
+        if row is not None:
+            yield row
+
+
+def _probe_endpoints(urls, fetch_one, errors):
+    """Hedged fan-out: fetch every URL at once and return (rows, last_error)
+    for the first populated answer, so one dead endpoint costs max(timeouts),
+    not the sum. rows is None when every endpoint failed or came back empty."""
+    futures = [_PROBE_POOL.submit(fetch_one, url) for url in urls]
+    last_error = None
+    for future in concurrent.futures.as_completed(futures):
+        try:
+            result = future.result()
+        except errors as exc:
+            last_error = exc
+            continue
+        if result:
+            for other in futures:
+                other.cancel()
+            return result, None
+    return None, last_error
+
+
+# filter_and_sort keeps at most 100 rows, so there is no point reading a
+# page past the point where 100 rows have already been extracted.
+_MAX_HTML_ROWS = 100
+
+
+def _fetch_html_rows(url: str):
+    # Decode and scan the body in 64 KiB chunks: parsing overlaps the socket
+    # receive, the full page is never buffered as one str, and the read loop
+    # exits early once enough rows are in hand. Only complete rows (up to the
+    # last </tr>) are scanned; the tail carries over to the next chunk.
+    decoder = codecs.getincrementaldecoder("utf-8")("ignore")
+    rows = []
+    buffer = ""
+    for chunk in _iter_body(url, timeout=10):
+        buffer += decoder.decode(chunk)
+        end = buffer.rfind("</tr>")
+        if end < 0:
+            continue
+        end += len("</tr>")
+        rows.extend(itertools.islice(_iter_html_rows(buffer[:end]), _MAX_HTML_ROWS - len(rows)))
+        buffer = buffer[end:]
+        if len(rows) >= _MAX_HTML_ROWS:
+            return rows
+    buffer += decoder.decode(b"", final=True)
+    rows.extend(itertools.islice(_iter_html_rows(buffer), _MAX_HTML_ROWS - len(rows)))
+    return rows
+
+
+_HTML_ERRORS = (urllib.error.URLError, urllib.error.HTTPError, TimeoutError)
 
 
+@functools.lru_cache(maxsize=64)
 def fetch_html_results(query: str, category_key: str):
     encoded_query = urllib.parse.quote(query)
     last_error = None
-    for endpoint in HTML_ENDPOINTS:
-        for cat in CATEGORY_SETS[category_key]:
-            url = endpoint.format(query=encoded_query, cat=cat)
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            try:
-                with urllib.request.urlopen(req, timeout=10) as resp:
-                    html = resp.read().decode("utf-8", errors="ignore")
-                parser = TPBHTMLParser()
-                parser.feed(html)
-                if parser.rows:
-                    return parser.rows
-            except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as exc:
-                last_error = exc
-                continue
+    # Categories stay the OUTER loop, tightest first: every endpoint gets a
+    # shot at the narrow category before the search broadens.
+    for cat in CATEGORY_SETS[category_key]:
+        urls = [template % (encoded_query, cat) for template in _HTML_TEMPLATES]
+        rows, error = _probe_endpoints(urls, _fetch_html_rows, _HTML_ERRORS)
+        if rows:
+            return tuple(rows)
+        last_error = error or last_error
     if last_error:
         raise RuntimeError(f"All HTML endpoints failed. Last error: {last_error}")
-    return []
+    return ()
+
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
-def human_size(size_bytes: int) -> str:
-    size = float(size_bytes)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
+
+def human_size(size_bytes) -> str:
+    # The unit index is just floor(log2(n) / 10); bit_length gives it without
+    # the divide-by-1024 loop. API rows carry sizes as strings, hence int().
+    n = int(size_bytes)
+    if n <= 0:
+        return "0.0 B"
+    k = min((n.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{n / (1 << (k * 10)):.1f} {_SIZE_UNITS[k]}"
 
 
 def build_magnet(info_hash: str, name: str) -> str:
     # Light encoding: leave separators/colons intact; encode values only.
-    xt = f"urn:btih:{info_hash}"
     dn = urllib.parse.quote(name, safe=" ")
-    trackers = "&".join(f"tr={urllib.parse.quote(tr)}" for tr in TRACKERS)
-    return f"magnet:?xt={xt}&dn={dn}&{trackers}"
+    return f"magnet:?xt=urn:btih:{info_hash}&dn={dn}&{_TRACKERS_QS}"
+
+
+def _fetch_json_rows(url: str):
+    body = _http_get(url, timeout=8).decode("utf-8", errors="ignore")
+    data = json.loads(body)
+    if not isinstance(data, list):
+        return []
+    # The API returns counts as strings; normalize the sort key here, before
+    # the rows land in the result cache, so nothing downstream has to mutate
+    # cached rows. HTML rows already carry ints from _make_row.
+    for row in data:
+        row["seeders"] = int(row.get("seeders", 0))
+    return data
+
+
+_API_ERRORS = _HTML_ERRORS + (json.JSONDecodeError,)
+
+# A failed failover cascade is expensive — every endpoint timing out — so
+# remember recent total failures briefly and fail fast if the same search is
+# retried right away (e.g. the user mashing Enter on a dead query). Successful
+# searches, even empty ones, are already covered by the lru_cache.
+_FAILURE_TTL = 30.0  # seconds
+_recent_failures = {}
+_failures_lock = threading.Lock()
 
 
+def _note_failure(query: str, category_key: str) -> None:
+    with _failures_lock:
+        _recent_failures[(query, category_key)] = time.monotonic()
+
+
+def _recently_failed(query: str, category_key: str) -> bool:
+    with _failures_lock:
+        stamp = _recent_failures.get((query, category_key))
+    return stamp is not None and time.monotonic() - stamp < _FAILURE_TTL
+
+
+# Re-running the same search (e.g. after tweaking the resolution filter) is
+# common; caching raw rows per (query, category_key) skips the whole network
+# round-trip. filter_and_sort stays outside the cache so filter changes are
+# free. Results are returned as tuples so cached values stay intact.
+@functools.lru_cache(maxsize=64)
 def fetch_results(query: str, category_key: str):
+    # Reject queries that could only waste a full failover cascade: too short
+    # or nothing alphanumeric for the API to match on.
+    stripped = query.strip()
+    if len(stripped) < 2 or not any(ch.isalnum() for ch in stripped):
+        return ()
+    if _recently_failed(query, category_key):
+        raise RuntimeError("All endpoints just failed for this search; retry in a moment.")
     encoded_query = urllib.parse.quote(query)
     last_error = None
-    for endpoint in API_ENDPOINTS:
-        for cat in CATEGORY_SETS[category_key]:
-            url = endpoint.format(query=encoded_query, category=cat)
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            try:
-                with urllib.request.urlopen(req, timeout=8) as resp:
-                    body = resp.read().decode("utf-8", errors="ignore")
-                data = json.loads(body)
-                if isinstance(data, list) and data:
-                    return data
-                # If empty, try next category/endpoint.
-            except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as exc:
-                last_error = exc
-                continue
-            except json.JSONDecodeError as exc:
-                last_error = exc
-                continue
-    html_rows = fetch_html_results(query, category_key)
+    # Categories stay the OUTER loop, tightest first: every endpoint gets a
+    # shot at the narrow category before the search broadens.
+    for cat in CATEGORY_SETS[category_key]:
+        urls = [template % (encoded_query, cat) for template in _API_TEMPLATES]
+        data, error = _probe_endpoints(urls, _fetch_json_rows, _API_ERRORS)
+        if data:
+            return tuple(data)
+        last_error = error or last_error
+    try:
+        html_rows = fetch_html_results(query, category_key)
+    except RuntimeError:
+        _note_failure(query, category_key)
+        raise
     if html_rows:
         return html_rows
     if last_error:
+        _note_failure(query, category_key)
         raise RuntimeError(f"All proxy endpoints/categories failed. Last error: {last_error}")
-    return []
+    return ()
 
 
 def sanitize_display_name(text: str) -> str:
@@ -225,37 +494,31 @@ def sanitize_display_name(text: str) -> str:
     )
 
 
+# Case-insensitive substring scans in C; avoids allocating a lowercased copy
+# of every title just to check a handful of fixed markers.
+_RE_1080 = re.compile(r"1080", re.I)
+_RE_4K = re.compile(r"2160|4k|uhd", re.I)
+
+
+def _passes(name: str, resolution: str) -> bool:
+    if resolution == "1080":
+        return _RE_1080.search(name) is not None
+    if resolution == "4k":
+        return _RE_4K.search(name) is not None
+    return True
+
+
 def filter_and_sort(rows, resolution: str = "1080"):
-    filtered = []
-    for row in rows:
-        name = row.get("name", "")
-        if not name:
-            continue
-        lower_name = name.lower()
-        if resolution == "1080" and "1080" not in lower_name:
-            continue
-        if resolution == "4k":
-            has_4k = "2160" in lower_name or "4k" in lower_name or "uhd" in lower_name
-            if not has_4k:
-                continue
-        info_hash = row.get("info_hash")
-        if not info_hash:
-            continue
-        seeders = int(row.get("seeders", 0))
-        leechers = int(row.get("leechers", 0))
-        size = int(row.get("size", 0))
-        # Sanitize display name to avoid Tk/emoji rendering crash
-        display_name = sanitize_display_name(name)
-        filtered.append(
-            {
-                "name": display_name,
-                "info_hash": info_hash,
-                "seeders": seeders,
-                "leechers": leechers,
-                "size": size,
-            }
-        )
-    filtered.sort(key=lambda r: r["seeders"], reverse=True)
+    # Keep the original row dicts rather than rebuilding a dict-of-5 per row;
+    # both fetch paths deliver seeders as int, so the rows — which may be
+    # shared with the result cache — are never touched here. Display
+    # formatting happens at insert time.
+    filtered = [
+        row
+        for row in rows
+        if row.get("name") and row.get("info_hash") and _passes(row["name"], resolution)
+    ]
+    filtered.sort(key=operator.itemgetter("seeders"), reverse=True)
     return filtered[:100]
 
 
@@ -270,51 +533,88 @@ def create_app():
     magnet_var = tk.StringVar()
     resolution_var = tk.StringVar(value="1080")  # options: 4k, 1080, any
 
+    # Fetches run on a worker thread so endpoint failovers (up to several
+    # seconds of timeouts) don't freeze the Tk event loop; results are
+    # marshaled back to the main thread via root.after.
+    search_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+    # Magnet links per table iid, built once when rows are inserted; clicking
+    # around the results then never re-quotes name/trackers.
+    magnets_by_iid = {}
+
+    def _apply_results(results, resolution):
+        search_button.state(["!disabled"])
+        # Precompute every display tuple (including the formatted size and
+        # the magnet link) up front, then run the delete+insert batch with
+        # the widget hidden so Tk does a single relayout instead of one per
+        # inserted row.
+        magnets_by_iid.clear()
+        prepared = []
+        for idx, row in enumerate(results, start=1):
+            iid = str(idx)
+            # Sanitize here (not in filter_and_sort) so only displayed rows
+            # pay for it; avoids a Tk/emoji rendering crash.
+            display_name = sanitize_display_name(row["name"])
+            magnets_by_iid[iid] = build_magnet(row["info_hash"], display_name)
+            prepared.append(
+                (iid, (display_name, row["seeders"], row["leechers"], human_size(row["size"])))
+            )
+        table.configure(show="")
+        try:
+            table.delete(*table.get_children())
+            for iid, values in prepared:
+                table.insert("", "end", iid=iid, values=values)
+        finally:
+            table.configure(show="headings")
+        if results:
+            status_var.set(f"Found {len(results)} results. Double-click to copy magnet.")
+        else:
+            res_label = {
+                "4k": "4K",
+                "1080": "1080p",
+                "any": "any resolution",
+            }.get(resolution, "requested")
+            status_var.set(f"No {res_label} results. Try broader category or another filter.")
+
+    def _apply_error(exc):
+        search_button.state(["!disabled"])
+        status_var.set("Error")
+        messagebox.showerror("Search failed", str(exc))
+
     def on_search():
         query = query_var.get().strip()
         if not query:
             messagebox.showinfo("Missing query", "Please enter a search term.")
             return
-        try:
-            status_var.set("Searching…")
-            root.update_idletasks()
-            raw = fetch_results(query, category_var.get())
-            results = filter_and_sort(raw, resolution=resolution_var.get())
-            table.delete(*table.get_children())
-            for idx, row in enumerate(results, start=1):
-                table.insert(
-                    "",
-                    "end",
-                    iid=str(idx),
-                    values=(
-                        row["name"],
-                        row["seeders"],
-                        row["leechers"],
-                        human_size(row["size"]),
-                    ),
-                    tags=(row["info_hash"],),
-                )
-            if results:
-                status_var.set(f"Found {len(results)} results. Double-click to copy magnet.")
+        category = category_var.get()
+        resolution = resolution_var.get()
+        # Disable the button so overlapping searches can't be submitted.
+        search_button.state(["disabled"])
+        status_var.set("Searching…")
+
+        def worker():
+            try:
+                raw = fetch_results(query, category)
+                results = filter_and_sort(raw, resolution=resolution)
+            except Exception as exc:  # pylint: disable=broad-except
+                root.after(0, _apply_error, exc)
             else:
-                res_label = {
-                    "4k": "4K",
-                    "1080": "1080p",
-                    "any": "any resolution",
-                }.get(resolution_var.get(), "requested")
-                status_var.set(f"No {res_label} results. Try broader category or another filter.")
-        except Exception as exc:  # pylint: disable=broad-except
-            status_var.set("Error")
-            messagebox.showerror("Search failed", str(exc))
+                root.after(0, _apply_results, results, resolution)
+
+        search_pool.submit(worker)
 
     def on_row_selected(event):
         item_id = table.focus()
         if not item_id:
             return
-        info_hash = table.item(item_id, "tags")[0]
-        name = table.item(item_id, "values")[0]
-        magnet = build_magnet(info_hash, name)
-        magnet_var.set(magnet)
+        magnet_var.set(magnets_by_iid.get(item_id, ""))
+
+    def on_clear_cache():
+        fetch_results.cache_clear()
+        fetch_html_results.cache_clear()
+        with _failures_lock:
+            _recent_failures.clear()
+        status_var.set("Result cache cleared.")
 
     def copy_magnet():
         magnet = magnet_var.get()
@@ -348,7 +648,9 @@ def create_app():
     ttk.Radiobutton(res_frame, text="1080p", value="1080", variable=resolution_var).pack(side="left")
     ttk.Radiobutton(res_frame, text="Any", value="any", variable=resolution_var).pack(side="left")
 
-    ttk.Button(controls, text="Search", command=on_search).pack(side="left", padx=12)
+    search_button = ttk.Button(controls, text="Search", command=on_search)
+    search_button.pack(side="left", padx=12)
+    ttk.Button(controls, text="Clear cache", command=on_clear_cache).pack(side="left")
 
     # Table frame
     table_frame = ttk.Frame(root, padding=10)